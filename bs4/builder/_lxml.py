@@ -72,6 +72,11 @@ class LXMLTreeBuilderForXML(TreeBuilder):
         :param soup: A `BeautifulSoup`.
         """
         super(LXMLTreeBuilderForXML, self).initialize_soup(soup)
+        # A TreeBuilder may be reused for several documents; don't
+        # let namespaces left open by a previous (possibly
+        # malformed) document leak into this one.
+        self.nsmaps = [self.DEFAULT_NSMAPS_INVERTED]
+        self.active_namespace_prefixes = [dict(self.DEFAULT_NSMAPS)]
         self._register_namespaces(self.DEFAULT_NSMAPS)
 
     def _register_namespaces(self, mapping):
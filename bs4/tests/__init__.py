@@ -7,6 +7,7 @@ __license__ = "MIT"
 import pickle
 import copy
 import functools
+import itertools
 import warnings
 import pytest
 from bs4 import BeautifulSoup
@@ -29,8 +30,31 @@ from bs4.builder import (
 )
 default_builder = HTMLParserTreeBuilder
 
+# TreeBuilder instances shared by every SoupTest, keyed by TreeBuilder
+# class. A TreeBuilder resets itself at the start of each document, so
+# one instance can be reused for any parse that doesn't need custom
+# constructor arguments.
+_PARSER_CACHE = {}
+
+def _builder_for(builder_class):
+    """Find the shared TreeBuilder instance for a TreeBuilder class."""
+    builder = _PARSER_CACHE.get(builder_class)
+    if builder is None:
+        builder = _PARSER_CACHE[builder_class] = builder_class()
+    return builder
+
+@functools.lru_cache(maxsize=512)
+def _document_for(builder_class, markup):
+    """Turn an HTML fragment into a document, remembering the answer.
+
+    TreeBuilder.test_fragment_to_document is a pure function of the
+    markup, and the same fragments turn up over and over again in
+    the test suite.
+    """
+    return _builder_for(builder_class).test_fragment_to_document(markup)
+
 # Some tests depend on specific third-party libraries. We use
-# @pytest.mark.skipIf on the following conditionals to skip them
+# @pytest.mark.skipif on the following conditionals to skip them
 # if the libraries are not installed.
 try:
     from soupsieve import SelectorSyntaxError
@@ -52,6 +76,19 @@ except ImportError:
     LXML_PRESENT = False
     LXML_VERSION = (0,)
 
+if not (LXML_PRESENT or HTML5LIB_PRESENT):
+    # The generic tests always run against html.parser, but the
+    # builder-specific test suites will all be skipped. Make sure
+    # that doesn't go unnoticed.
+    warnings.warn(
+        "Neither lxml nor html5lib is installed, so only the html.parser "
+        "tree builder will be tested."
+    )
+
+# SoupStrainers don't change once they're created, so tests that
+# need the same one can share it.
+B_STRAINER = SoupStrainer("b")
+
 BAD_DOCUMENT = """A bare string
 <!DOCTYPE xsl:stylesheet SYSTEM "htmlent.dtd">
 <!DOCTYPE xsl:stylesheet PUBLIC "htmlent.dtd">
@@ -95,8 +132,25 @@ class SoupTest(object):
     def default_builder(self):
         return default_builder
 
+    @property
+    def builder(self):
+        """An instance of `default_builder`.
+
+        The instance is created the first time it's needed and reused
+        for every document parsed afterwards, the same way
+        BeautifulSoup.__copy__ reuses its builder.
+        """
+        builder = getattr(self, '_builder', None)
+        if builder is None:
+            builder = self._builder = _builder_for(self.default_builder)
+        return builder
+
     def soup(self, markup, **kwargs):
         """Build a Beautiful Soup object from markup."""
+        if not kwargs:
+            # Nothing needs to be passed into the TreeBuilder
+            # constructor, so the cached builder will do.
+            return BeautifulSoup(markup, builder=self.builder)
         builder = kwargs.pop('builder', self.default_builder)
         return BeautifulSoup(markup, builder=builder, **kwargs)
 
@@ -105,13 +159,17 @@ class SoupTest(object):
 
         The details depend on the builder.
         """
-        return self.default_builder(**kwargs).test_fragment_to_document(markup)
+        if kwargs:
+            return self.default_builder(**kwargs).test_fragment_to_document(
+                markup
+            )
+        return _document_for(self.default_builder, markup)
    
     def assert_soup(self, to_parse, compare_parsed_to=None):
         """Parse some markup using Beautiful Soup and verify that
         the output markup is as expected.
         """
-        builder = self.default_builder
+        builder = self.builder
         obj = BeautifulSoup(to_parse, builder=builder)
         if compare_parsed_to is None:
             compare_parsed_to = to_parse
@@ -131,7 +189,41 @@ class SoupTest(object):
         assert [obj.ROOT_TAG_NAME] == [x.name for x in obj.tagStack]
 
     assertSoupEquals = assert_soup
+
+    def assert_soup_batch(self, pairs):
+        """Run assert_soup() on a number of small fragments in turn.
+
+        All of the fragments are parsed with the same TreeBuilder, so
+        its setup cost is only paid once.
+
+        :param pairs: An iterable of markup strings, or of
+            (to_parse, compare_parsed_to) 2-tuples.
+        """
+        for pair in pairs:
+            if isinstance(pair, tuple):
+                self.assert_soup(*pair)
+            else:
+                self.assert_soup(pair)
         
+    def assert_soup_tree_equals(self, a, b):
+        """Verify that two parse trees have the same structure.
+
+        The trees are walked side by side and the comparison stops at
+        the first difference, so neither tree has to be turned back
+        into markup.
+        """
+        for x, y in itertools.zip_longest(
+                itertools.chain([a], a.descendants),
+                itertools.chain([b], b.descendants)
+        ):
+            assert x.__class__ == y.__class__
+            if isinstance(x, Tag):
+                assert x.name == y.name
+                assert x.attrs == y.attrs
+                assert x.is_empty_element == y.is_empty_element
+            else:
+                assert x == y
+
     def assertConnectedness(self, element):
         """Ensure that next_element and previous_element are properly
         set for all descendants of the given element.
@@ -339,6 +431,11 @@ class HTMLTreeBuilderSmokeTest(TreeBuilderSmokeTest):
     markup in these tests, there's not much room for interpretation.
     """
 
+    # A real-world document in ISO-8859-8 (a Hebrew encoding), and
+    # what it should look like once converted to UTF-8.
+    HEBREW_DOCUMENT = b'<html><head><title>Hebrew (ISO 8859-8) in Visual Directionality</title></head><body><h1>Hebrew (ISO 8859-8) in Visual Directionality</h1>\xed\xe5\xec\xf9</body></html>'
+    HEBREW_DOCUMENT_UTF8 = HEBREW_DOCUMENT.decode("iso8859-8").encode("utf-8")
+
     def test_empty_element_tags(self):
         """Verify that all HTML4 and HTML5 empty element (aka void element) tags
         are handled correctly.
@@ -374,7 +471,7 @@ class HTMLTreeBuilderSmokeTest(TreeBuilderSmokeTest):
         dumped = pickle.dumps(tree, 2)
         loaded = pickle.loads(dumped)
         assert loaded.__class__ == BeautifulSoup
-        assert loaded.decode() == tree.decode()
+        self.assert_soup_tree_equals(loaded, tree)
 
     def assertDoctypeHandled(self, doctype_fragment):
         """Assert that a given doctype string is handled correctly."""
@@ -523,10 +620,11 @@ class HTMLTreeBuilderSmokeTest(TreeBuilderSmokeTest):
 
         This applies to all tags except empty-element tags.
         """
-        self.assert_soup("<p>", "<p></p>")
-        self.assert_soup("<b>", "<b></b>")
-
-        self.assert_soup("<br>", "<br/>")
+        self.assert_soup_batch([
+            ("<p>", "<p></p>"),
+            ("<b>", "<b></b>"),
+            ("<br>", "<br/>"),
+        ])
 
     def test_br_is_always_empty_element_tag(self):
         """A <br> tag is designated as an empty-element tag.
@@ -618,16 +716,15 @@ Hello, world!
                   '<tr><td>foo</td></tr>'
                   '</table></td>')
 
-        self.assert_soup(
-            markup,
-            '<table id="1"><tr><td>Here\'s another table:'
-            '<table id="2"><tr><td>foo</td></tr></table>'
-            '</td></tr></table>')
-
-        self.assert_soup(
+        self.assert_soup_batch([
+            (markup,
+             '<table id="1"><tr><td>Here\'s another table:'
+             '<table id="2"><tr><td>foo</td></tr></table>'
+             '</td></tr></table>'),
             "<table><thead><tr><td>Foo</td></tr></thead>"
             "<tbody><tr><td>Bar</td></tr></tbody>"
-            "<tfoot><tr><td>Baz</td></tr></tfoot></table>")
+            "<tfoot><tr><td>Baz</td></tr></tfoot></table>",
+        ])
 
     def test_multivalued_attribute_with_whitespace(self):
         # Whitespace separating the values of a multi-valued attribute
@@ -688,17 +785,21 @@ Hello, world!
         
     def test_entities_in_attributes_converted_to_unicode(self):
         expect = '<p id="pi\N{LATIN SMALL LETTER N WITH TILDE}ata"></p>'
-        self.assert_soup('<p id="pi&#241;ata"></p>', expect)
-        self.assert_soup('<p id="pi&#xf1;ata"></p>', expect)
-        self.assert_soup('<p id="pi&#Xf1;ata"></p>', expect)
-        self.assert_soup('<p id="pi&ntilde;ata"></p>', expect)
+        self.assert_soup_batch([
+            ('<p id="pi&#241;ata"></p>', expect),
+            ('<p id="pi&#xf1;ata"></p>', expect),
+            ('<p id="pi&#Xf1;ata"></p>', expect),
+            ('<p id="pi&ntilde;ata"></p>', expect),
+        ])
 
     def test_entities_in_text_converted_to_unicode(self):
         expect = '<p>pi\N{LATIN SMALL LETTER N WITH TILDE}ata</p>'
-        self.assert_soup("<p>pi&#241;ata</p>", expect)
-        self.assert_soup("<p>pi&#xf1;ata</p>", expect)
-        self.assert_soup("<p>pi&#Xf1;ata</p>", expect)
-        self.assert_soup("<p>pi&ntilde;ata</p>", expect)
+        self.assert_soup_batch([
+            ("<p>pi&#241;ata</p>", expect),
+            ("<p>pi&#xf1;ata</p>", expect),
+            ("<p>pi&#Xf1;ata</p>", expect),
+            ("<p>pi&ntilde;ata</p>", expect),
+        ])
 
     def test_quot_entity_converted_to_quotation_mark(self):
         self.assert_soup("<p>I said &quot;good day!&quot;</p>",
@@ -706,9 +807,11 @@ Hello, world!
 
     def test_out_of_range_entity(self):
         expect = "\N{REPLACEMENT CHARACTER}"
-        self.assert_soup("&#10000000000000;", expect)
-        self.assert_soup("&#x10000000000000;", expect)
-        self.assert_soup("&#1000000000;", expect)
+        self.assert_soup_batch([
+            ("&#10000000000000;", expect),
+            ("&#x10000000000000;", expect),
+            ("&#1000000000;", expect),
+        ])
        
     def test_multipart_strings(self):
         "Mostly to prevent a recurrence of a bug in the html5lib treebuilder."
@@ -721,8 +824,10 @@ Hello, world!
         """Verify consistent handling of empty-element tags,
         no matter how they come in through the markup.
         """
-        self.assert_soup('<br/><br/><br/>', "<br/><br/><br/>")
-        self.assert_soup('<br /><br /><br />', "<br/><br/><br/>")
+        self.assert_soup_batch([
+            ('<br/><br/><br/>', "<br/><br/><br/>"),
+            ('<br /><br /><br />', "<br/><br/><br/>"),
+        ])
         
     def test_head_tag_between_head_and_body(self):
         "Prevent recurrence of a bug in the html5lib treebuilder."
@@ -787,9 +892,8 @@ Hello, world!
 
     def test_soupstrainer(self):
         """Parsers should be able to work with SoupStrainers."""
-        strainer = SoupStrainer("b")
         soup = self.soup("A <b>bold</b> <meta/> <i>statement</i>",
-                         parse_only=strainer)
+                         parse_only=B_STRAINER)
         assert soup.decode() == "<b>bold</b>"
 
     def test_single_quote_attribute_values_become_double_quotes(self):
@@ -809,12 +913,12 @@ Hello, world!
             """<foo attr="Brawls happen at &quot;Bob\'s Bar&quot;">a</foo>""")
 
     def test_ampersand_in_attribute_value_gets_escaped(self):
-        self.assert_soup('<this is="really messed up & stuff"></this>',
-                              '<this is="really messed up &amp; stuff"></this>')
-
-        self.assert_soup(
-            '<a href="http://example.org?a=1&b=2;3">foo</a>',
-            '<a href="http://example.org?a=1&amp;b=2;3">foo</a>')
+        self.assert_soup_batch([
+            ('<this is="really messed up & stuff"></this>',
+             '<this is="really messed up &amp; stuff"></this>'),
+            ('<a href="http://example.org?a=1&b=2;3">foo</a>',
+             '<a href="http://example.org?a=1&amp;b=2;3">foo</a>'),
+        ])
 
     def test_escaped_ampersand_in_attribute_value_is_left_alone(self):
         self.assert_soup('<a href="http://example.org?a=1&amp;b=2;3"></a>')
@@ -891,15 +995,12 @@ Hello, world!
     def test_real_hebrew_document(self):
         # A real-world test to make sure we can convert ISO-8859-9 (a
         # Hebrew encoding) to UTF-8.
-        hebrew_document = b'<html><head><title>Hebrew (ISO 8859-8) in Visual Directionality</title></head><body><h1>Hebrew (ISO 8859-8) in Visual Directionality</h1>\xed\xe5\xec\xf9</body></html>'
         soup = self.soup(
-            hebrew_document, from_encoding="iso8859-8")
+            self.HEBREW_DOCUMENT, from_encoding="iso8859-8")
         # Some tree builders call it iso8859-8, others call it iso-8859-9.
         # That's not a difference we really care about.
         assert soup.original_encoding in ('iso8859-8', 'iso-8859-8')
-        assert soup.encode('utf-8') == (
-            hebrew_document.decode("iso8859-8").encode("utf-8")
-        )
+        assert soup.encode('utf-8') == self.HEBREW_DOCUMENT_UTF8
 
     def test_meta_tag_reflects_current_encoding(self):
         # Here's the <meta> tag saying that a document is
@@ -1005,7 +1106,7 @@ class XMLTreeBuilderSmokeTest(TreeBuilderSmokeTest):
         dumped = pickle.dumps(tree, 2)
         loaded = pickle.loads(dumped)
         assert loaded.__class__ == BeautifulSoup
-        assert loaded.decode() == tree.decode()
+        self.assert_soup_tree_equals(loaded, tree)
 
     def test_docstring_generated(self):
         soup = self.soup("<root/>")
@@ -1102,8 +1203,7 @@ class XMLTreeBuilderSmokeTest(TreeBuilderSmokeTest):
         assert soup.encode("utf-8") == markup
 
     def test_tags_are_empty_element_if_and_only_if_they_are_empty(self):
-        self.assert_soup("<p>", "<p/>")
-        self.assert_soup("<p>foo</p>")
+        self.assert_soup_batch([("<p>", "<p/>"), "<p>foo</p>"])
 
     def test_namespaces_are_preserved(self):
         markup = '<root xmlns:a="http://example.com/" xmlns:b="http://example.net/"><a:foo>This tag is in the a namespace</a:foo><b:foo>This tag is in the b namespace</b:foo></root>'
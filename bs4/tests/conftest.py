@@ -0,0 +1,16 @@
+"""pytest configuration for the Beautiful Soup test suite."""
+
+# Use of this source code is governed by the MIT license.
+__license__ = "MIT"
+
+import pytest
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    # The tests don't share any state beyond caches that are safe to
+    # rebuild in each process, so if pytest-xdist is installed, spread
+    # them out over all available CPUs. Passing "-n" explicitly
+    # (including "-n 0") overrides this.
+    if (config.pluginmanager.hasplugin("xdist")
+        and config.getoption("numprocesses", None) is None):
+        config.option.numprocesses = "auto"
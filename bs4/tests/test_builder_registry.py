@@ -26,7 +26,7 @@ if LXML_PRESENT:
 
 
 # TODO: Split out the lxml and html5lib tests into their own classes
-# and gate with pytest.mark.skipIf.
+# and gate with pytest.mark.skipif.
 class TestBuiltInRegistry(object):
     """Test the built-in registry with the default builders registered."""
 
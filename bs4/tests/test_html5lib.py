@@ -4,8 +4,8 @@ import pytest
 import warnings
 
 from bs4 import BeautifulSoup
-from bs4.element import SoupStrainer
 from . import (
+    B_STRAINER,
     HTML5LIB_PRESENT,
     HTML5TreeBuilderSmokeTest,
     SoupTest,
@@ -25,10 +25,9 @@ class TestHTML5LibBuilder(SoupTest, HTML5TreeBuilderSmokeTest):
 
     def test_soupstrainer(self):
         # The html5lib tree builder does not support SoupStrainers.
-        strainer = SoupStrainer("b")
         markup = "<p>A <b>bold</b> statement.</p>"
         with warnings.catch_warnings(record=True) as w:
-            soup = BeautifulSoup(markup, "html5lib", parse_only=strainer)
+            soup = BeautifulSoup(markup, "html5lib", parse_only=B_STRAINER)
         assert soup.decode() == self.document_for(markup)
 
         [warning] = w
@@ -44,16 +43,15 @@ class TestHTML5LibBuilder(SoupTest, HTML5TreeBuilderSmokeTest):
                   '<tr><td>foo</td></tr>'
                   '</table></td>')
 
-        self.assert_soup(
-            markup,
-            '<table id="1"><tbody><tr><td>Here\'s another table:'
-            '<table id="2"><tbody><tr><td>foo</td></tr></tbody></table>'
-            '</td></tr></tbody></table>')
-
-        self.assert_soup(
+        self.assert_soup_batch([
+            (markup,
+             '<table id="1"><tbody><tr><td>Here\'s another table:'
+             '<table id="2"><tbody><tr><td>foo</td></tr></tbody></table>'
+             '</td></tr></tbody></table>'),
             "<table><thead><tr><td>Foo</td></tr></thead>"
             "<tbody><tr><td>Bar</td></tr></tbody>"
-            "<tfoot><tr><td>Baz</td></tr></tfoot></table>")
+            "<tfoot><tr><td>Baz</td></tr></tfoot></table>",
+        ])
 
     def test_xml_declaration_followed_by_doctype(self):
         markup = '''<?xml version="1.0" encoding="utf-8"?>
@@ -33,8 +33,10 @@ class TestHTMLParserTreeBuilder(SoupTest, HTMLTreeBuilderSmokeTest):
         assert isinstance(loaded.builder, type(tree.builder))
 
     def test_redundant_empty_element_closing_tags(self):
-        self.assert_soup('<br></br><br></br><br></br>', "<br/><br/><br/>")
-        self.assert_soup('</br></br></br>', "")
+        self.assert_soup_batch([
+            ('<br></br><br></br><br></br>', "<br/><br/><br/>"),
+            ('</br></br></br>', ""),
+        ])
 
     def test_empty_element(self):
         # This verifies that any buffered data present when the parser
@@ -33,12 +33,11 @@ class TestLXMLTreeBuilder(SoupTest, HTMLTreeBuilderSmokeTest):
         return LXMLTreeBuilder
 
     def test_out_of_range_entity(self):
-        self.assert_soup(
-            "<p>foo&#10000000000000;bar</p>", "<p>foobar</p>")
-        self.assert_soup(
-            "<p>foo&#x10000000000000;bar</p>", "<p>foobar</p>")
-        self.assert_soup(
-            "<p>foo&#1000000000;bar</p>", "<p>foobar</p>")
+        self.assert_soup_batch([
+            ("<p>foo&#10000000000000;bar</p>", "<p>foobar</p>"),
+            ("<p>foo&#x10000000000000;bar</p>", "<p>foobar</p>"),
+            ("<p>foo&#1000000000;bar</p>", "<p>foobar</p>"),
+        ])
         
     def test_entities_in_foreign_document_encoding(self):
         # We can't implement this case correctly because by the time we
@@ -199,3 +198,16 @@ class TestLXMLXMLTreeBuilder(SoupTest, XMLTreeBuilderSmokeTest):
         unpickled = pickle.loads(pickled)
         assert "some markup" == unpickled.a.string
         assert unpickled.builder is None
+
+    def test_namespaces_reset_between_documents(self):
+        # A TreeBuilder that's reused for a second document doesn't
+        # remember namespaces left open by the first one.
+        builder = self.default_builder()
+        BeautifulSoup(
+            '<root><prefix:tag xmlns:prefix="http://prefixed-namespace.com">',
+            builder=builder
+        )
+        soup = BeautifulSoup('<root><tag/></root>', builder=builder)
+        assert soup.tag._namespaces == {
+            'xml': 'http://www.w3.org/XML/1998/namespace',
+        }
@@ -241,12 +241,12 @@ class TestPersistence(SoupTest):
         dumped = pickle.dumps(self.tree, 2)
         loaded = pickle.loads(dumped)
         assert loaded.__class__ == BeautifulSoup
-        assert loaded.decode() == self.tree.decode()
+        self.assert_soup_tree_equals(loaded, self.tree)
 
     def test_deepcopy_identity(self):
         # Making a deepcopy of a tree yields an identical tree.
         copied = copy.deepcopy(self.tree)
-        assert copied.decode() == self.tree.decode()
+        self.assert_soup_tree_equals(copied, self.tree)
 
     def test_copy_preserves_encoding(self):
         soup = BeautifulSoup(b'<p>&nbsp;</p>', 'html.parser')
@@ -280,7 +280,7 @@ class TestPersistence(SoupTest):
         soup = self.soup(html)
         dumped = pickle.dumps(soup, pickle.HIGHEST_PROTOCOL)
         loaded = pickle.loads(dumped)
-        assert loaded.decode() == soup.decode()
+        self.assert_soup_tree_equals(loaded, soup)
 
     def test_copy_navigablestring_is_not_attached_to_tree(self):
         html = "<b>Foo<a></a></b><b>Bar</b>"
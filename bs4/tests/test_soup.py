@@ -23,12 +23,12 @@ from bs4.builder import (
 )
 from bs4.element import (
     Comment,
-    SoupStrainer,
     Tag,
     NavigableString,
 )
 
 from . import (
+    B_STRAINER,
     default_builder,
     LXML_PRESENT,
     SoupTest,
@@ -249,7 +249,7 @@ class TestWarnings(SoupTest):
         with warnings.catch_warnings(record=True) as w:
             soup = BeautifulSoup(
                 "<a><b></b></a>", "html.parser",
-                parseOnlyThese=SoupStrainer("b"),
+                parseOnlyThese=B_STRAINER,
             )
         warning = self._assert_warning(w, DeprecationWarning)
         msg = str(warning.message)
@@ -339,8 +339,7 @@ class TestSelectiveParsing(SoupTest):
 
     def test_parse_with_soupstrainer(self):
         markup = "No<b>Yes</b><a>No<b>Yes <c>Yes</c></b>"
-        strainer = SoupStrainer("b")
-        soup = self.soup(markup, parse_only=strainer)
+        soup = self.soup(markup, parse_only=B_STRAINER)
         assert soup.encode() == b"<b>Yes</b><b>Yes <c>Yes</c></b>"
 
         